@@ -18,7 +18,8 @@ config :nosedrum,
 
 config :bolt, Bolt.Repo,
   adapter: Ecto.Adapters.Postgres,
-  url: System.get_env("PGSQL_URL")
+  url: System.get_env("PGSQL_URL"),
+  pool_size: String.to_integer(System.get_env("PGSQL_POOL_SIZE") || "25")
 
 config :nostrum,
   token: System.get_env("BOT_TOKEN"),
@@ -10,12 +10,17 @@ defmodule Bolt.Cogs.Clean do
   alias Bolt.Parsers
   alias Nosedrum.Predicates
   alias Nostrum.Api
-  alias Nostrum.Cache.Mapping.ChannelGuild
   alias Nostrum.Struct.Message
   alias Nostrum.Struct.User
 
+  @usage ["clean <amount:int>", "clean <options...>"]
+
+  # Assembled once at compile time instead of on every bare invocation.
+  @usage_response "ℹ️ usage: `#{List.first(@usage)}` or `#{List.last(@usage)}`, " <>
+                    "see `help clean` for options"
+
   @impl true
-  def usage, do: ["clean <amount:int>", "clean <options...>"]
+  def usage, do: @usage
 
   @impl true
   def description,
@@ -79,28 +84,29 @@ defmodule Bolt.Cogs.Clean do
   def command(msg, {options, [], []}) when options != [] do
     with {:ok, target_channel_id} <-
            parse_channel(msg.guild_id, options[:channel], msg.channel_id),
+         # Validate the `--user` flags up front: a typo in them should not
+         # cost us a fetch of up to 1000 messages that we then throw away.
+         {:ok, user_ids} <- parse_users(msg.guild_id, Keyword.get_values(options, :user)),
          limit <- min(Keyword.get(options, :limit, 100), 1000),
          {:ok, messages} when messages != [] <-
            Api.get_channel_messages(target_channel_id, limit, {:before, msg.id}),
          {:ok, message_stream} <- apply_filter(messages, :bots, options[:bots], msg.guild_id),
          {:ok, message_stream} <-
-           apply_filter(message_stream, :user, options[:user], msg.guild_id),
+           apply_filter(message_stream, :user, user_ids, msg.guild_id),
          {:ok, message_stream} <-
            apply_filter(message_stream, :content, options[:content], msg.guild_id),
          false <- Enum.empty?(message_stream),
          messages_to_delete <- Enum.to_list(message_stream),
          message_ids <- Enum.map(messages_to_delete, & &1.id),
-         {:ok} <- Api.bulk_delete_messages(msg.channel_id, message_ids) do
+         # Kick off the deletion first: formatting the mod log file then
+         # runs while the API round trip is in flight. The await must not
+         # time out - the ratelimiter may hold the request back for longer.
+         delete_task =
+           Task.async(fn -> Api.bulk_delete_messages(msg.channel_id, message_ids) end),
+         log_content = build_log_content(messages_to_delete),
+         {:ok} <- Task.await(delete_task, :infinity) do
       Api.create_reaction(msg.channel_id, msg.id, "👌")
 
-      log_content =
-        messages_to_delete
-        |> Stream.map(
-          &"#{String.pad_leading(&1.author.username, 20)}##{&1.author.discriminator}: #{&1.content}"
-        )
-        |> Enum.reverse()
-        |> Enum.join("\n")
-
       ModLog.emit(
         msg.guild_id,
         "MESSAGE_CLEAN",
@@ -130,11 +136,7 @@ defmodule Bolt.Cogs.Clean do
   end
 
   def command(msg, {[], [], []}) do
-    response =
-      "ℹ️ usage: `#{List.first(usage())}` or `#{List.last(usage())}`, " <>
-        "see `help clean` for options"
-
-    {:ok, _msg} = Api.create_message(msg.channel_id, response)
+    {:ok, _msg} = Api.create_message(msg.channel_id, @usage_response)
   end
 
   def command(msg, {[], [maybe_amount | []], []}) do
@@ -204,22 +206,37 @@ defmodule Bolt.Cogs.Clean do
     do: {:ok, Stream.reject(messages, & &1.author.bot)}
 
   defp apply_filter(messages, :user, nil, _guild_id), do: {:ok, messages}
-  # single `--user` flag given, `OptionParser` passes it as a string
-  defp apply_filter(messages, :user, user, _guild_id) when is_bitstring(user) do
-    [%Message{channel_id: channel_id}] = Enum.take(messages, 1)
-
-    with {:ok, guild_id} <- ChannelGuild.get_guild(channel_id),
-         {:ok, snowflake} <- parse_snowflake(guild_id, user) do
-      filtered = Stream.filter(messages, &(&1.author.id == snowflake))
-      {:ok, filtered}
-    else
-      error ->
-        error
-    end
+
+  # `user_ids` were parsed and validated before the messages were fetched,
+  # so the filter is a single constant-time membership test per message.
+  defp apply_filter(messages, :user, user_ids, _guild_id) do
+    {:ok, Stream.filter(messages, &MapSet.member?(user_ids, &1.author.id))}
   end
 
-  # multiple `--user` flags given
-  defp apply_filter(messages, :user, users, guild_id) do
+  defp apply_filter(messages, :content, nil, _guild_id), do: {:ok, messages}
+
+  defp apply_filter(messages, :content, content, _guild_id) do
+    # Normalize the needle a single time - the per-message work is then
+    # only a downcase of the candidate and a substring scan.
+    needle = String.downcase(content)
+    {:ok, Stream.filter(messages, &String.contains?(String.downcase(&1.content), needle))}
+  end
+
+  @spec build_log_content([Message.t()]) :: String.t()
+  defp build_log_content(messages_to_delete) do
+    messages_to_delete
+    |> Stream.map(
+      &"#{String.pad_leading(&1.author.username, 20)}##{&1.author.discriminator}: #{&1.content}"
+    )
+    |> Enum.reverse()
+    |> Enum.join("\n")
+  end
+
+  @spec parse_users(Guild.id(), [String.t()]) ::
+          {:ok, MapSet.t(User.id()) | nil} | {:error, String.t()}
+  defp parse_users(_guild_id, []), do: {:ok, nil}
+
+  defp parse_users(guild_id, users) do
     parsed_snowflakes = Enum.map(users, &parse_snowflake(guild_id, &1))
 
     # Did any given flag not parse correctly?
@@ -234,18 +251,10 @@ defmodule Bolt.Cogs.Clean do
 
       {:error, "🚫 failed to parse `--user` flag:\n#{error_description}"}
     else
-      # If not, return only messages that were sent by the given snowflakes.
-      filtered_messages = Stream.filter(messages, &(&1.author.id in parsed_snowflakes))
-      {:ok, filtered_messages}
+      {:ok, MapSet.new(parsed_snowflakes, fn {:ok, snowflake} -> snowflake end)}
     end
   end
 
-  defp apply_filter(messages, :content, nil, _guild_id), do: {:ok, messages}
-
-  defp apply_filter(messages, :content, content, _guild_id) do
-    {:ok, Stream.filter(messages, &(content in &1.content))}
-  end
-
   @spec parse_snowflake(Guild.id(), String.t()) :: {:ok, User.id()} | {:error, String.t()}
   defp parse_snowflake(guild_id, user_string) do
     case Integer.parse(user_string) do
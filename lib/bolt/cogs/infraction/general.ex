@@ -21,11 +21,15 @@ defmodule Bolt.Cogs.Infraction.General do
     "timeout" => "⏱️"
   }
 
+  # Unroll the map into one function clause per type so lookups compile
+  # down to a pattern match instead of building and probing a map at runtime.
   @spec emoji_for_type(String.t()) :: String.t()
-  def emoji_for_type(type) do
-    Map.get(@type_emojis, type, "?")
+  for {type, emoji} <- @type_emojis do
+    def emoji_for_type(unquote(type)), do: unquote(emoji)
   end
 
+  def emoji_for_type(_unknown_type), do: "?"
+
   @spec format_user(Nostrum.Struct.Snowflake.t(), Nostrum.Struct.Snowflake.t()) :: String.t()
   def format_user(guild_id, user_id) do
     default_string = "unknown user (`#{user_id}`)"
@@ -10,7 +10,16 @@ defmodule Bolt.Cogs.Infraction.List do
   alias Nostrum.Api
   alias Nostrum.Cache.Me
   alias Nostrum.Struct.Embed
-  import Ecto.Query, only: [from: 2]
+  import Ecto.Query, only: [from: 2, where: 3]
+
+  # Upper bound of rows fetched for display. The paginator keeps all pages
+  # in memory, so fetching a guild's full infraction history at once buys
+  # nothing - older entries remain reachable via `infr user` and `infr detail`.
+  @fetch_limit 150
+
+  # Only the columns the overview actually renders. `reason` and `data`
+  # can be large and are only shown by `infr detail`.
+  @display_fields [:id, :type, :user_id, :actor_id, :active, :inserted_at, :expires_at]
 
   @impl true
   def usage, do: ["infraction list"]
@@ -18,7 +27,7 @@ defmodule Bolt.Cogs.Infraction.List do
   @impl true
   def description,
     do: """
-    List all infractions on this guild.
+    List the #{@fetch_limit} most recent infractions on this guild.
     Requires the `MANAGE_MESSAGES` permission.
 
     When `--no-automod` is given (e.g. `infr list --no-automod`), does not show any infractions created by the automod.
@@ -43,39 +52,17 @@ defmodule Bolt.Cogs.Infraction.List do
 
   @impl true
   def command(msg, {[], [], []}) do
-    query =
-      from(
-        infr in Infraction,
-        where: infr.guild_id == ^msg.guild_id,
-        order_by: [desc: infr.inserted_at],
-        select: infr
-      )
-
-    respond(query, msg)
+    respond(base_query(msg.guild_id), msg)
   end
 
-  @impl true
   def command(msg, {[automod: true], [], []}) do
-    query =
-      from(
-        infr in Infraction,
-        where: infr.guild_id == ^msg.guild_id and infr.actor_id == ^Me.get().id,
-        order_by: [desc: infr.inserted_at],
-        select: infr
-      )
+    query = where(base_query(msg.guild_id), [infr], infr.actor_id == ^Me.get().id)
 
     respond(query, msg, "Infractions on this guild created by automod")
   end
 
-  @impl true
   def command(msg, {[automod: false], [], []}) do
-    query =
-      from(
-        infr in Infraction,
-        where: infr.guild_id == ^msg.guild_id and infr.actor_id != ^Me.get().id,
-        order_by: [desc: infr.inserted_at],
-        select: infr
-      )
+    query = where(base_query(msg.guild_id), [infr], infr.actor_id != ^Me.get().id)
 
     respond(query, msg, "Infractions on this guild excluding automod")
   end
@@ -85,10 +72,32 @@ defmodule Bolt.Cogs.Infraction.List do
     {:ok, _msg} = Api.create_message(msg.channel_id, response)
   end
 
+  # The automod variants stack their actor condition on top of this via
+  # `where`, which combines with the guild condition using AND.
+  @spec base_query(Guild.id()) :: Ecto.Query.t()
+  defp base_query(guild_id) do
+    from(
+      infr in Infraction,
+      where: infr.guild_id == ^guild_id,
+      order_by: [desc: infr.inserted_at],
+      limit: @fetch_limit,
+      select: struct(infr, @display_fields)
+    )
+  end
+
   @spec respond(Ecto.Query.t(), Message.t(), String.t()) :: {:ok, Message.t()}
   defp respond(query, msg, title \\ "All infractions on this guild") do
     queryset = Repo.all(query)
 
+    # The same moderators and repeat offenders show up in many rows, so
+    # resolve every distinct user through the cache exactly once instead
+    # of twice per displayed infraction.
+    user_strings =
+      queryset
+      |> Enum.flat_map(&[&1.user_id, &1.actor_id])
+      |> Enum.uniq()
+      |> Map.new(&{&1, Humanizer.human_user(&1)})
+
     base_embed = %Embed{
       title: title,
       color: Constants.color_blue()
@@ -102,8 +111,8 @@ defmodule Bolt.Cogs.Infraction.List do
             "##{infr.id} #{General.emoji_for_type(infr.type)} #{if Infraction.is_active?(infr), do: "(active)", else: ""}",
           value:
             """
-            **User**: #{Humanizer.human_user(infr.user_id)}
-            **Actor**: #{Humanizer.human_user(infr.actor_id)}
+            **User**: #{user_strings[infr.user_id]}
+            **Actor**: #{user_strings[infr.actor_id]}
             **Creation**: <t:#{DateTime.to_unix(infr.inserted_at)}:R>
             """ <>
               if(
@@ -48,9 +48,13 @@ defmodule Bolt.Cogs.Infraction.User do
           color: Constants.color_blue()
         }
 
+        # Shared by every entry's expiry check - read the clock once
+        # instead of once per infraction.
+        now = DateTime.utc_now()
+
         formatted_entries =
           queryset
-          |> Stream.map(&format_entry/1)
+          |> Stream.map(&format_entry(&1, now))
           |> Stream.chunk_every(6)
           |> Enum.map(fn entry_chunk ->
             %Embed{
@@ -77,15 +81,12 @@ defmodule Bolt.Cogs.Infraction.User do
     "<t:#{unix_stamp}:R>"
   end
 
-  @spec format_expiry(DateTime) :: String.t()
-  @spec format_expiry(nil) :: String.t()
-  defp format_expiry(nil) do
+  @spec format_expiry(DateTime | nil, DateTime) :: String.t()
+  defp format_expiry(nil, _now) do
     ""
   end
 
-  defp format_expiry(dt) do
-    now = DateTime.utc_now()
-
+  defp format_expiry(dt, now) do
     if DateTime.compare(now, dt) == :gt do
       "(expired #{format_relative_datetime(dt)}) "
     else
@@ -93,23 +94,19 @@ defmodule Bolt.Cogs.Infraction.User do
     end
   end
 
-  @spec format_entry(Infraction) :: String.t()
-  def format_entry(infr) do
+  @spec format_entry(Infraction, DateTime) :: String.t()
+  def format_entry(infr, now \\ DateTime.utc_now()) do
+    # Active infractions are surrounded by bold markup on both sides;
+    # determine it once instead of re-checking activity per side.
+    active_markup = if Infraction.is_active?(infr), do: "**", else: ""
+
     "[`#{infr.id}`] " <>
       "#{General.emoji_for_type(infr.type)} " <>
-      format_surrounding_markup_for_active_infractions(infr) <>
+      active_markup <>
       format_relative_datetime(infr.inserted_at) <>
       " " <>
-      format_expiry(infr.expires_at) <>
-      format_surrounding_markup_for_active_infractions(infr) <>
+      format_expiry(infr.expires_at, now) <>
+      active_markup <>
       if(infr.reason != nil, do: ": #{infr.reason}", else: "")
   end
-
-  defp format_surrounding_markup_for_active_infractions(infr) do
-    if Infraction.is_active?(infr) do
-      "**"
-    else
-      ""
-    end
-  end
 end
@@ -38,7 +38,6 @@ defmodule Bolt.Cogs.Kick do
       with reason <- Enum.join(reason_list, " "),
            {:ok, member} <- Converters.to_member(msg.guild_id, user),
            {:ok, true} <- Helpers.is_above(msg.guild_id, msg.author.id, member.user.id),
-           {:ok} <- Api.remove_guild_member(msg.guild_id, member.user.id),
            infraction <- %{
              type: "kick",
              guild_id: msg.guild_id,
@@ -47,6 +46,7 @@ defmodule Bolt.Cogs.Kick do
              reason: if(reason != "", do: reason, else: nil)
            },
            changeset <- Infraction.changeset(%Infraction{}, infraction),
+           {:ok} <- Api.remove_guild_member(msg.guild_id, member.user.id),
            {:ok, _created_infraction} <- Repo.insert(changeset) do
         ModLog.emit(
           msg.guild_id,
@@ -145,6 +145,55 @@ defmodule Bolt.Helpers do
   @doc "Checks that `actor_id`'s top role is above `target_id`s top role on `guild_id`."
   @spec is_above(Guild.id(), User.id(), User.id()) :: {:ok, true | false} | {:error, String.t()}
   def is_above(guild_id, actor_id, target_id) do
+    case GuildCache.get(guild_id) do
+      {:ok, guild} ->
+        # Reading a guild out of the cache copies the full guild struct.
+        # Compare both members against the same snapshot instead of
+        # copying the guild once per member and once per role lookup.
+        with {:ok, actor_position} <- top_role_position(guild, actor_id) do
+          {:ok, above_target?(guild, actor_position, target_id)}
+        else
+          {:error, _reason} ->
+            {:error,
+             "you need to be above the target user in the role " <>
+               "hierarchy to run that, but you don't have any roles"}
+        end
+
+      {:error, _reason} ->
+        is_above_uncached(guild_id, actor_id, target_id)
+    end
+  end
+
+  @spec above_target?(Guild.t(), Role.position(), User.id()) :: boolean()
+  defp above_target?(guild, actor_position, target_id) do
+    case top_role_position(guild, target_id) do
+      {:ok, target_position} ->
+        actor_position > target_position
+
+      # The target either left the guild or has no roles - in both
+      # cases the actor is above them in the role hierarchy.
+      {:error, _reason} ->
+        true
+    end
+  end
+
+  @spec top_role_position(Guild.t(), User.id()) ::
+          {:ok, Role.position()} | {:error, String.t()}
+  defp top_role_position(guild, member_id) do
+    with %Member{roles: role_ids} <-
+           Map.get(guild.members, member_id, {:error, "member not found"}),
+         {:ok, role} <- find_role(guild.roles, role_ids) do
+      {:ok, role.position}
+    else
+      {:error, _reason} = error -> error
+    end
+  end
+
+  # Slow path for guilds missing from the cache: `top_role_for/2`
+  # falls back to fetching members and roles from the API.
+  @spec is_above_uncached(Guild.id(), User.id(), User.id()) ::
+          {:ok, true | false} | {:error, String.t()}
+  defp is_above_uncached(guild_id, actor_id, target_id) do
     case top_role_for(guild_id, actor_id) do
       {:ok, actor_top_role} ->
         case top_role_for(guild_id, target_id) do
@@ -47,9 +47,9 @@ defmodule Bolt.Moderation do
            actor_id: actor.id,
            reason: if(reason != "", do: reason, else: nil)
          },
+         changeset = Infraction.changeset(%Infraction{}, infraction),
          {:ok, true} <- Helpers.is_above(guild_id, actor.id, target_id),
          {:ok} <- Api.create_guild_ban(guild_id, target_id, 7),
-         changeset <- Infraction.changeset(%Infraction{}, infraction),
          {:ok, created_infraction} <- Repo.insert(changeset) do
       ModLog.emit(
         guild_id,
@@ -1,4 +1,13 @@
 defmodule Bolt.Repo do
+  @moduledoc """
+  The PostgreSQL repository.
+
+  Backed by Postgrex, so queries never block the caller beyond their own
+  round trip: every checkout runs on a pooled connection process and
+  gateway event consumers stay responsive while commands wait on the
+  database.
+  """
+
   use Ecto.Repo,
     otp_app: :bolt,
     adapter: Ecto.Adapters.Postgres
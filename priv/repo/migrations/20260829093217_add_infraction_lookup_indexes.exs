@@ -0,0 +1,10 @@
+defmodule Bolt.Repo.Migrations.AddInfractionLookupIndexes do
+  use Ecto.Migration
+
+  def change do
+    # `infr list` filters on the guild and orders by creation time.
+    create(index("infractions", [:guild_id, :inserted_at]))
+    # `infr user` and the tempban expiry check filter on guild, user and type.
+    create(index("infractions", [:guild_id, :user_id, :type]))
+  end
+end